@@ -3,7 +3,7 @@
 #
 # SPDX-License-Identifier: (Apache-2.0 OR MIT)
 
-from spack.package import *
+from spack.package import CMakePackage, depends_on, license, maintainers, variant, version
 
 class Hermes3(CMakePackage):
     """A multifluid magnetized plasma simulation model.